@@ -0,0 +1,262 @@
+import math
+import random
+import time
+
+FPS = 30  # Frame clock shared with the recorder
+MAX_CATCHUP_FRAMES = 5  # Frames to replay at once if the event loop falls behind
+
+# Easing functions map progress t in [0, 1] to eased progress
+def linear(t):
+    return t
+
+def ease_in_quad(t):
+    return t * t
+
+def ease_out_quad(t):
+    return 1 - (1 - t) * (1 - t)
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+def ease_out_back(t):
+    c1 = 1.70158
+    c3 = c1 + 1
+    return 1 + c3 * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+EASINGS = {
+    "linear": linear,
+    "ease_in": ease_in_quad,
+    "ease_out": ease_out_quad,
+    "ease_in_out": ease_in_out_quad,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_out_back": ease_out_back,
+}
+
+class Tween:
+    """A frame-counted animation on a single object.
+
+    Subclasses implement sample(frame) for frame in [1, frames] and return
+    an (offset_x, offset_y, scale) contribution, or move the object's base
+    position directly.
+    """
+    def __init__(self, obj, frames, easing="linear"):
+        self.obj = obj
+        self.frames = max(1, int(frames))
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.frame = 0
+
+    @property
+    def done(self):
+        return self.frame >= self.frames
+
+    def progress(self):
+        return self.easing(self.frame / self.frames)
+
+    def step(self):
+        self.frame += 1
+        return self.sample(self.frame)
+
+    def sample(self, frame):
+        return 0, 0, 1.0
+
+    def finish(self):
+        """Called once when the tween ends or is cancelled"""
+        pass
+
+class Shake(Tween):
+    """Jitter around the base position, offsets drawn up front from a seeded RNG"""
+    def __init__(self, obj, rng, frames=3, amplitude=5):
+        super().__init__(obj, frames)
+        self.offsets = [(rng.randint(-amplitude, amplitude), rng.randint(-amplitude, amplitude))
+                        for _ in range(self.frames - 1)]
+        # Always settle back on the base position on the last frame
+        self.offsets.append((0, 0))
+
+    def sample(self, frame):
+        dx, dy = self.offsets[frame - 1]
+        return dx, dy, 1.0
+
+class Move(Tween):
+    """Move the object's base position to (x, y)"""
+    def __init__(self, obj, x, y, frames=15, easing="ease_in_out"):
+        super().__init__(obj, frames, easing)
+        self.start = obj.pos
+        self.target = (x, y)
+
+    def sample(self, frame):
+        t = self.progress()
+        x = self.start[0] + (self.target[0] - self.start[0]) * t
+        y = self.start[1] + (self.target[1] - self.start[1]) * t
+        self.obj.pos = (round(x, 2), round(y, 2))
+        return 0, 0, 1.0
+
+    def finish(self):
+        if self.done:
+            self.obj.pos = self.target
+
+class Pulse(Tween):
+    """Scale up to `amount` and back down to the original size, in place"""
+    def __init__(self, obj, amount=1.15, frames=8, easing="ease_out"):
+        super().__init__(obj, frames, easing)
+        self.amount = amount
+
+    def sample(self, frame):
+        t = self.easing(math.sin(math.pi * frame / self.frames))
+        # Quantise so repeated pulses hit the same cached image sizes
+        scale = round(1 + (self.amount - 1) * t, 3)
+        # Objects are anchored top-left, shift them so the pulse stays centred
+        width, height = self.obj.base_size()
+        return -(scale - 1) * width / 2, -(scale - 1) * height / 2, scale
+
+class Animator:
+    """Tween engine driven by after() on the Tk event loop.
+
+    The animator owns the frame clock: every tick advances all tweens by one
+    frame, pushes the result to the objects and then notifies frame listeners
+    (the recorder) with the frame index. Tweens only count frames, so the
+    same sequence of calls always yields the same recorded motion.
+    """
+    def __init__(self, widget, fps=FPS, seed=0):
+        self.widget = widget
+        self.fps = fps
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.frame = 0
+        self.tweens = []
+        self.listeners = []
+        self._after_id = None
+        self._clock_start = None
+
+    def start(self):
+        if self._after_id is not None:
+            return
+        self._clock_start = time.perf_counter() - self.frame / self.fps
+        self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def reset(self, seed=None):
+        """Restart the frame count and RNG, e.g. when a take starts.
+
+        Running tweens are jumped to their end state, so after a reset the
+        same sequence of calls produces the same motion on the same frame
+        indices, regardless of what happened earlier.
+        """
+        for tween in self.tweens:
+            tween.frame = tween.frames
+            tween.finish()
+        for obj in {t.obj for t in self.tweens}:
+            obj.apply_animation((0, 0), 1.0)
+        self.tweens = []
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+        self.frame = 0
+        self.reset_clock()
+
+    def reset_clock(self):
+        """Realign the wall clock with the current frame"""
+        self._clock_start = time.perf_counter() - self.frame / self.fps
+
+    def add_listener(self, callback):
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def add(self, tween):
+        self.tweens.append(tween)
+        return tween
+
+    def is_animating(self, obj, kind=Tween):
+        return any(t.obj is obj and isinstance(t, kind) for t in self.tweens)
+
+    def cancel(self, obj, kind=Tween):
+        """Drop obj's tweens of the given kind and restore its resting transform"""
+        kept = []
+        for tween in self.tweens:
+            if tween.obj is obj and isinstance(tween, kind):
+                tween.finish()
+            else:
+                kept.append(tween)
+        self.tweens = kept
+        if not self.is_animating(obj):
+            obj.apply_animation((0, 0), 1.0)
+
+    def shake(self, obj, frames=3, amplitude=5):
+        if self.is_animating(obj, Shake):
+            return None
+        return self.add(Shake(obj, self.rng, frames, amplitude))
+
+    def move(self, obj, x, y, frames=15, easing="ease_in_out"):
+        self.cancel(obj, Move)
+        return self.add(Move(obj, x, y, frames, easing))
+
+    def pulse(self, obj, amount=1.15, frames=8, easing="ease_out"):
+        self.cancel(obj, Pulse)
+        return self.add(Pulse(obj, amount, frames, easing))
+
+    def step(self):
+        """Advance every tween by exactly one frame and notify listeners"""
+        self.frame += 1
+        transforms = {}
+        for tween in self.tweens:
+            dx, dy, scale = tween.step()
+            ox, oy, oscale = transforms.get(tween.obj, (0, 0, 1.0))
+            transforms[tween.obj] = (ox + dx, oy + dy, oscale * scale)
+
+        finished = [t for t in self.tweens if t.done]
+        self.tweens = [t for t in self.tweens if not t.done]
+        for tween in finished:
+            tween.finish()
+
+        for obj, (dx, dy, scale) in transforms.items():
+            obj.apply_animation((dx, dy), scale)
+
+        for callback in list(self.listeners):
+            callback(self.frame)
+
+    def _tick(self):
+        self._after_id = None
+        due = int((time.perf_counter() - self._clock_start) * self.fps)
+        behind = due - self.frame
+        if behind > MAX_CATCHUP_FRAMES:
+            # Too far behind to replay, drop wall-clock time instead of frames
+            self._clock_start += (behind - MAX_CATCHUP_FRAMES) / self.fps
+            behind = MAX_CATCHUP_FRAMES
+        try:
+            for _ in range(max(1, behind)):
+                self.step()
+        except Exception as e:
+            # Keep the frame clock alive; a failing tween or listener must not
+            # freeze animations and recording for the rest of the session
+            print(f"Error in animation frame {self.frame}: {e}")
+            # step() may have stopped before pruning, never step a done tween again
+            self.tweens = [t for t in self.tweens if not t.done]
+        finally:
+            self._schedule()
+
+    def _schedule(self):
+        next_time = self._clock_start + (self.frame + 1) / self.fps
+        delay = max(1, int((next_time - time.perf_counter()) * 1000))
+        self._after_id = self.widget.after(delay, self._tick)
+
+_animator = None
+
+def get_animator(widget=None):
+    """Return the shared animator, creating it on widget's event loop"""
+    global _animator
+    if _animator is None:
+        if widget is None:
+            raise RuntimeError("Animator has not been created yet")
+        _animator = Animator(widget.winfo_toplevel())
+        _animator.start()
+    return _animator
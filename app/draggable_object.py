@@ -1,8 +1,7 @@
 import tkinter as tk
+import math
 from PIL import Image, ImageTk
-import random
-import time
-import threading
+from .animation import get_animator
 
 class DraggableObject:
     selected_object = None
@@ -17,7 +16,10 @@ class DraggableObject:
         self.state = 0
         self.locked = False
         self.original_pos = (x, y)
-        self.is_shaking = False
+        self.anim_offset = (0, 0)  # Transient offset applied by the animator
+        self.anim_scale = 1.0  # Transient scale applied by the animator
+        self.deleted = False
+        self.tk_image_cache = {}  # (anim_scale, rotation, current_scale) -> tk images
         self.is_resizing = False  # Track if we're resizing via shift+drag
         self.hotkey = hotkey
 
@@ -67,10 +69,18 @@ class DraggableObject:
         DraggableObject.instances.append(self)
 
     def _generate_tk_images(self):
+        key = (self.anim_scale, self.rotation, self.current_scale)
+        if key in self.tk_image_cache:
+            return self.tk_image_cache[key]
+        # Only keep pulse frames for the current rotation and scale, so
+        # interactive resizing does not grow the cache without bound
+        self.tk_image_cache = {k: v for k, v in self.tk_image_cache.items() if k[1:] == key[1:]}
+        scale = self.current_scale * self.anim_scale
         images = [img.rotate(self.rotation, expand=True).resize(
-            (int(img.width * self.current_scale), int(img.height * self.current_scale)),
+            (int(img.width * scale), int(img.height * scale)),
             Image.Resampling.LANCZOS) for img in self.original_images]
-        return [ImageTk.PhotoImage(img) for img in images]
+        self.tk_image_cache[key] = [ImageTk.PhotoImage(img) for img in images]
+        return self.tk_image_cache[key]
 
     def on_shift_press(self, event):
         if self.is_dragging:
@@ -176,8 +186,9 @@ class DraggableObject:
         self.canvas.itemconfig(self.id, image=self.tk_images[self.state])
         self.update_resize_handle()
         
-        # Add random shake with 0.3 probability
-        if random.random() < 0.3:
+        # Add random shake with 0.3 probability, drawn from the animator's
+        # seeded RNG so recorded takes are reproducible
+        if get_animator(self.canvas).rng.random() < 0.3:
             self.shake()
 
     def resize(self, scale):
@@ -193,6 +204,7 @@ class DraggableObject:
         self.update_resize_handle()
 
     def delete(self):
+        get_animator(self.canvas).cancel(self)
         # Remove hotkey mapping
         if self.hotkey:
             DraggableObject.hotkey_map.pop(self.hotkey, None)
@@ -201,6 +213,7 @@ class DraggableObject:
         self.canvas.unbind_all("<KeyRelease-Shift_L>")
         self.canvas.unbind_all("<KeyRelease-Shift_R>")
         # Continue with normal deletion
+        self.deleted = True
         self.canvas.delete(self.id)
         if self.resize_handle:
             self.canvas.delete(self.resize_handle)
@@ -233,35 +246,39 @@ class DraggableObject:
             fill_color = "red" if self.locked else "blue"
             self.canvas.itemconfig(self.resize_handle, fill=fill_color)
 
-    def shake(self):
-        if self.is_shaking:
-            return
-        
-        self.is_shaking = True
-        original_x, original_y = self.pos
-        
-        def shake_animation():
-            # Random offset between -5 and 5 pixels
-            offset_x = random.randint(-5, 5)
-            offset_y = random.randint(-5, 5)
-            
-            # Move to offset position
-            self.canvas.coords(self.id, original_x + offset_x, original_y + offset_y)
-            self.pos = (original_x + offset_x, original_y + offset_y)
-            self.update_resize_handle()
-            
-            # Wait a short time
-            time.sleep(0.1)
-            
-            # Return to original position
-            self.canvas.coords(self.id, original_x, original_y)
-            self.pos = (original_x, original_y)
-            self.update_resize_handle()
-            
-            self.is_shaking = False
+    def shake(self, frames=3, amplitude=5):
+        get_animator(self.canvas).shake(self, frames, amplitude)
+
+    def move_to(self, x, y, frames=15, easing="ease_in_out"):
+        get_animator(self.canvas).move(self, x, y, frames, easing)
+
+    def pulse(self, amount=1.15, frames=8):
+        get_animator(self.canvas).pulse(self, amount, frames)
+
+    def base_size(self):
+        """Size of the current image without any animation scale"""
+        img = self.original_images[self.state]
+        w, h = img.width * self.current_scale, img.height * self.current_scale
+        angle = math.radians(self.rotation)
+        return (abs(w * math.cos(angle)) + abs(h * math.sin(angle)),
+                abs(w * math.sin(angle)) + abs(h * math.cos(angle)))
 
-        # Run shake animation in a separate thread
-        threading.Thread(target=shake_animation).start()
+    def display_pos(self):
+        """Position on screen, including any animation offset"""
+        return (self.pos[0] + self.anim_offset[0], self.pos[1] + self.anim_offset[1])
+
+    def apply_animation(self, offset, scale):
+        """Called by the animator on the Tk thread once per frame"""
+        if self.deleted:
+            return
+        rescale = scale != self.anim_scale
+        self.anim_offset = offset
+        self.anim_scale = scale
+        if rescale:
+            self.tk_images = self._generate_tk_images()
+            self.canvas.itemconfig(self.id, image=self.tk_images[self.state])
+        self.canvas.coords(self.id, *self.display_pos())
+        self.update_resize_handle()
 
     @classmethod
     def get_by_hotkey(cls, key):
@@ -3,6 +3,7 @@ import cv2
 import numpy as np
 from PIL import Image
 from .draggable_object import DraggableObject
+from .animation import FPS
 import time
 import threading
 import queue
@@ -12,32 +13,153 @@ is_paused = False
 is_fill_mode = False  # New state for fill mode
 pause_start_time = None
 temp_video_path = 'exports/temp_recording.mp4'
-FPS = 30  # Fixed FPS
+
+MASTER_NAME = "master"  # The only profile saved without a name suffix
+
+class OutputProfile:
+    """One encoded output of a take.
+
+    size is the encoded (width, height); the composite is downscaled to fit
+    inside it keeping its aspect ratio and letterboxed with black bars to
+    fill the rest. None keeps the composite size. Every fps_divisor-th frame
+    is encoded, at FPS / fps_divisor.
+    """
+    def __init__(self, name, size=None, fps_divisor=1, codec='mp4v'):
+        self.name = name
+        self.size = size
+        self.fps_divisor = max(1, int(fps_divisor))
+        self.codec = codec
+
+    def output_path(self, base_path):
+        """Path for this profile next to base_path, e.g. take_720p.mp4"""
+        if self.name == MASTER_NAME:
+            return base_path
+        root, ext = os.path.splitext(base_path)
+        return f"{root}_{self.name}{ext}"
+
+    def frame_size(self, width, height):
+        """Encoded size for a width x height composite"""
+        return self.size if self.size is not None else (width, height)
+
+    def content_size(self, width, height):
+        """Size of the downscaled composite inside the letterbox"""
+        if self.size is None:
+            return width, height
+        scale = min(1.0, self.size[0] / width, self.size[1] / height)
+        # Most codecs need even dimensions
+        return max(2, int(width * scale) // 2 * 2), max(2, int(height * scale) // 2 * 2)
+
+MASTER = OutputProfile(MASTER_NAME)
+PROXY_720P = OutputProfile("720p", (1280, 720))
+PROXY_480P = OutputProfile("480p", (854, 480))
+
+class ProfileEncoder:
+    """Encodes one profile on its own thread, fed by the downscale stage"""
+    def __init__(self, profile, content_size, size):
+        self.profile = profile
+        self.content_size = content_size
+        self.size = size
+        self.path = profile.output_path(temp_video_path)
+        self.queue = queue.Queue()
+        fourcc = cv2.VideoWriter_fourcc(*profile.codec)
+        self.writer = cv2.VideoWriter(self.path, fourcc, FPS / profile.fps_divisor, size)
+        self.thread = None
+        if not self.writer.isOpened():
+            print(f"Error: could not open '{profile.codec}' encoder for {profile.name} at {size[0]}x{size[1]}")
+            self.writer.release()
+            return
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def is_open(self):
+        return self.thread is not None
+
+    def _run(self):
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                break
+            self.writer.write(frame)
+        self.writer.release()
+
+    def close(self):
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join()
+
+def downscale_frame(frame, sizes):
+    """Resize frame once per distinct size, largest first.
+
+    Each size is produced from the smallest frame already computed that is
+    still at least as large, so 480p is derived from 720p rather than from
+    the full composite.
+    """
+    height, width = frame.shape[:2]
+    scaled = {(width, height): frame}
+    for size in sorted(set(sizes), key=lambda s: s[0] * s[1], reverse=True):
+        if size in scaled:
+            continue
+        source = min((f for s, f in scaled.items() if s[0] >= size[0] and s[1] >= size[1]),
+                     key=lambda f: f.shape[0] * f.shape[1])
+        scaled[size] = cv2.resize(source, size, interpolation=cv2.INTER_AREA)
+    return scaled
+
+def letterbox_frame(frame, size):
+    """Centre frame on a black size canvas"""
+    height, width = frame.shape[:2]
+    if (width, height) == tuple(size):
+        return frame
+    left = (size[0] - width) // 2
+    top = (size[1] - height) // 2
+    return cv2.copyMakeBorder(frame, top, size[1] - height - top, left, size[0] - width - left,
+                              cv2.BORDER_CONSTANT, value=(0, 0, 0))
 
 # Thread-safe queue for frames
 frame_queue = queue.Queue()
 recording_thread = None
+recording_profiles = [MASTER]
 should_stop_recording = False
 frames_written = 0
 frames_captured = 0
 
 def frame_writer_worker():
     global should_stop_recording, frames_written
-    video_writer = None
+    encoders = None
     
     while not should_stop_recording or not frame_queue.empty():
         try:
             # Get frame with timeout to allow checking should_stop_recording
             frame = frame_queue.get(timeout=0.1)
+            # Frames composited on a worker pool arrive as futures, in capture order
+            if hasattr(frame, "result"):
+                try:
+                    frame = frame.result()
+                except Exception as e:
+                    # Drop the frame rather than killing the writer mid-take
+                    print(f"Error compositing frame {frames_written}: {e}")
+                    frame = None
             
-            # Initialize video writer with first frame
-            if video_writer is None and frame is not None:
+            # Initialize one encoder per profile with first frame
+            if encoders is None and frame is not None:
                 height, width = frame.shape[:2]
-                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                video_writer = cv2.VideoWriter(temp_video_path, fourcc, FPS, (width, height))
+                encoders = [ProfileEncoder(p, p.content_size(width, height), p.frame_size(width, height))
+                            for p in recording_profiles]
+                # Keep recording the profiles that did open; save_video_to_path reports the rest
+                encoders = [e for e in encoders if e.is_open]
             
-            if video_writer is not None and frame is not None:
-                video_writer.write(frame)
+            if encoders is not None and frame is not None:
+                # Composite once, downscale and letterbox once per size, fan out to the encoders
+                due = [e for e in encoders if frames_written % e.profile.fps_divisor == 0]
+                scaled = downscale_frame(frame, [e.content_size for e in due])
+                boxed = {}
+                for encoder in due:
+                    key = (encoder.content_size, encoder.size)
+                    if key not in boxed:
+                        boxed[key] = letterbox_frame(scaled[encoder.content_size], encoder.size)
+                    encoder.queue.put(boxed[key])
                 frames_written += 1
                 if frames_written % 30 == 0:  # Log every second (at 30fps)
                     print(f"Frames written: {frames_written}, Queue size: {frame_queue.qsize()}, seconds: {frames_written/FPS}")
@@ -47,8 +169,9 @@ def frame_writer_worker():
         except queue.Empty:
             continue
     
-    if video_writer is not None:
-        video_writer.release()
+    if encoders is not None:
+        for encoder in encoders:
+            encoder.close()
         print(f"Recording complete. Total frames written: {frames_written}")
 
 def toggle_fill():
@@ -59,59 +182,82 @@ def toggle_fill():
 def is_fill_mode_active():
     return is_fill_mode
 
-def export_jpg(max_width:int = 800, max_height:int = 800, padding:int = 20):
-    # Create exports directory if it doesn't exist
-    if not os.path.exists("exports"):
-        os.makedirs("exports")
-    
+def snapshot_scene():
+    """Capture what every object looks like right now.
+
+    Must be called on the Tk thread. The returned scene can be composited
+    later on any thread without racing the animator or user edits.
+    """
+    # Sort objects by their canvas order (bottom to top)
+    sorted_objects = sorted(DraggableObject.instances, key=lambda obj: obj.get_canvas_order())
+    return [(obj.original_images[obj.state], obj.display_pos(),
+             obj.current_scale * obj.anim_scale, obj.rotation) for obj in sorted_objects]
+
+def compose_frame(max_width:int = 800, max_height:int = 800, padding:int = 20, scene=None, fill=None):
+    if scene is None:
+        scene = snapshot_scene()
+    if fill is None:
+        fill = is_fill_mode
+
     # If in fill mode, return a pure green screen
-    if is_fill_mode:
+    if fill:
         # Create a green screen image of the same size as the canvas
-        cv_img = np.full((max_height - 2*padding, max_width - 2*padding, 3), (0, 255, 0), dtype=np.uint8)
-    else:
-        # Create a new image with canvas dimensions
-        img = Image.new('RGB', (max_width - 2*padding, max_height - 2*padding), 'white')
-        
-        # Sort objects by their canvas order (bottom to top)
-        sorted_objects = sorted(DraggableObject.instances, key=lambda obj: obj.get_canvas_order())
-        
-        # Get all objects from the canvas in correct order
-        for obj in sorted_objects:
-            # Get object position and image
-            x, y = obj.pos
-            # Adjust position by padding
-            x -= padding
-            y -= padding
-            # Get the current image state
-            current_img = obj.original_images[obj.state]
-            # Resize according to current scale
-            current_img = current_img.resize(
-                (int(current_img.width * obj.current_scale), 
-                 int(current_img.height * obj.current_scale)),
-                Image.Resampling.LANCZOS
-            )
-            # Rotate if needed
-            if obj.rotation != 0:
-                current_img = current_img.rotate(obj.rotation, expand=True)
-            # Paste onto the main image
-            img.paste(current_img, (int(x), int(y)), current_img if current_img.mode == 'RGBA' else None)
-        
-        # Convert PIL Image to OpenCV format
-        cv_img = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-    
-    # If we're recording and not paused, add frame to queue
-    global is_paused, frames_captured
-    if not is_paused:
-        frame_queue.put(cv_img.copy())
-        frames_captured += 1
-    
-    return cv_img
+        return np.full((max_height - 2*padding, max_width - 2*padding, 3), (0, 255, 0), dtype=np.uint8)
 
-def start_recording(max_width=800, max_height=800, padding=20):
-    global recording_thread, should_stop_recording, frames_written, frames_captured
+    # Create a new image with canvas dimensions
+    img = Image.new('RGB', (max_width - 2*padding, max_height - 2*padding), 'white')
+
+    for current_img, (x, y), scale, rotation in scene:
+        # Adjust position by padding
+        x -= padding
+        y -= padding
+        # Resize according to current scale
+        current_img = current_img.resize(
+            (int(current_img.width * scale), 
+             int(current_img.height * scale)),
+            Image.Resampling.LANCZOS
+        )
+        # Rotate if needed
+        if rotation != 0:
+            current_img = current_img.rotate(rotation, expand=True)
+        # Paste onto the main image
+        img.paste(current_img, (int(x), int(y)), current_img if current_img.mode == 'RGBA' else None)
+
+    # Convert PIL Image to OpenCV format
+    return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+
+def queue_frame(frame):
+    """Hand a frame (or a future resolving to one) to the writer, in order"""
+    global frames_captured
+    frame_queue.put(frame)
+    frames_captured += 1
+
+def start_recording(max_width=800, max_height=800, padding=20, profiles=None):
+    global recording_thread, recording_profiles, should_stop_recording, frames_written, frames_captured
+    profiles = list(profiles) if profiles else [MASTER]
+    names = [p.name for p in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate output profile names: {names}")
+    if MASTER_NAME not in names:
+        raise ValueError(f"Output profiles must include '{MASTER_NAME}': {names}")
+    recording_profiles = profiles
     should_stop_recording = False
     frames_written = 0
     frames_captured = 0
+    os.makedirs(os.path.dirname(temp_video_path), exist_ok=True)
+    # Remove outputs of a previous take so a failed encoder cannot pass them off as this one
+    for profile in recording_profiles:
+        path = profile.output_path(temp_video_path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    # Discard frames left over from a previous take
+    while not frame_queue.empty():
+        try:
+            frame_queue.get_nowait()
+            frame_queue.task_done()
+        except queue.Empty:
+            break
     
     # Start frame writer thread
     recording_thread = threading.Thread(target=frame_writer_worker)
@@ -135,15 +281,36 @@ def stop_recording():
     
     return True
 
+def missing_outputs():
+    """Names of the last take's profiles that produced no video"""
+    missing = []
+    for profile in recording_profiles:
+        path = profile.output_path(temp_video_path)
+        # A writer that failed to open may still leave an empty file behind
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            missing.append(profile.name)
+    return missing
+
 def save_video_to_path(target_path):
-    """Save the temporary video to the specified path"""
-    if os.path.exists(temp_video_path):
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    """Save the temporary videos of the last take to the specified path.
+
+    The master is saved as target_path, the other profiles next to it with
+    their name as suffix (take.mp4, take_720p.mp4, ...). Profiles that
+    produced no video are skipped; returns False only if none did.
+    """
+    missing = missing_outputs()
+    if len(missing) == len(recording_profiles):
+        return False
+    if missing:
+        print(f"Warning: no output for profiles: {', '.join(missing)}")
+    # Create directory if it doesn't exist
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    for profile in recording_profiles:
+        if profile.name in missing:
+            continue
         # Copy the file
-        os.replace(temp_video_path, target_path)
-        return True
-    return False
+        os.replace(profile.output_path(temp_video_path), profile.output_path(target_path))
+    return True
 
 def export_video():
     print(NotImplementedError("export_video")) 
@@ -2,21 +2,22 @@ import tkinter as tk
 from tkinter import filedialog
 from PIL import Image, ImageTk
 import time
-import threading
 from concurrent.futures import ThreadPoolExecutor
 from .draggable_object import DraggableObject
-from .export import export_jpg, start_recording, stop_recording, save_video_to_path, toggle_pause, is_recording_paused, get_pause_duration, FPS, toggle_fill, is_fill_mode_active
+from .animation import get_animator
+from .export import compose_frame, snapshot_scene, queue_frame, start_recording, stop_recording, save_video_to_path, missing_outputs, MASTER, PROXY_720P, PROXY_480P, toggle_pause, is_recording_paused, get_pause_duration, toggle_fill, is_fill_mode_active
 
 # Constants
 # max_width, max_height = 1440, 800
 max_width, max_height = 1920, 1080
 padding = 100  # Padding around canvas content
+# Every take is encoded as the master plus review proxies in one pass
+recording_profiles = [MASTER, PROXY_720P, PROXY_480P]
 
 # Global variables
 recording = False
 record_start_time = None
 thread_pool = None  # Initialize as None
-active_threads = set()
 
 def create_sidebar_icon(parent_frame, canvas, images, hotkey=None):
     thumbnail = images[0].resize((48, 48))
@@ -72,20 +73,15 @@ def create_thread_pool():
         thread_pool = ThreadPoolExecutor(max_workers=8)  # Limit to 8 concurrent threads
     return thread_pool
 
-def export_frame():
-    export_jpg(max_width, max_height, padding)
-    # Remove this thread from active threads when done
-    active_threads.remove(threading.current_thread())
-
-def record_loop():
-    frame_time = 1.0 / FPS
-    start = time.time()
-    while recording:
-        # Submit frame export to thread pool
-        create_thread_pool().submit(export_frame)
-        time.sleep(frame_time)
-    end = time.time()
-    print(f"Total time: {end - start}")
+def record_frame(frame):
+    """Animator listener: capture exactly one recorded frame per animation frame"""
+    if is_recording_paused():
+        return
+    # Snapshot on the Tk thread, composite on the pool, write in capture order
+    scene = snapshot_scene()
+    future = create_thread_pool().submit(
+        compose_frame, max_width, max_height, padding, scene, is_fill_mode_active())
+    queue_frame(future)
 
 def toggle_recording(status_label, record_btn):
     global recording, record_start_time
@@ -93,11 +89,14 @@ def toggle_recording(status_label, record_btn):
     if recording:
         record_start_time = time.time()
         update_recording_status(status_label)
-        start_recording(max_width, max_height, padding)
-        threading.Thread(target=record_loop).start()
+        start_recording(max_width, max_height, padding, recording_profiles)
+        animator = get_animator(status_label)
+        animator.reset()
+        animator.add_listener(record_frame)
         record_btn.config(text="Stop")
     else:
         update_recording_status(status_label)
+        get_animator(status_label).remove_listener(record_frame)
         stop_recording()
         # Shutdown thread pool
         if thread_pool:
@@ -112,8 +111,12 @@ def export_video(status_label):
         title="Save Recording As"
     )
     if file_path:
+        missing = missing_outputs()
         if save_video_to_path(file_path):
-            status_label.config(text=f"Recording saved to {file_path}")
+            if missing:
+                status_label.config(text=f"Recording saved to {file_path} (missing: {', '.join(missing)})")
+            else:
+                status_label.config(text=f"Recording saved to {file_path}")
         else:
             status_label.config(text="Error saving recording")
     else:
@@ -179,4 +182,7 @@ def setup_ui(root):
     # Bind keyboard events
     root.bind("<Key>", lambda e: on_key_press(e, canvas))
 
+    # Start the animation frame clock on the Tk event loop
+    get_animator(root)
+
     return root, sidebar, canvas, status_label 
\ No newline at end of file